@@ -1,6 +1,29 @@
+import logging
 from typing import Dict, Any
 from .base_agent import BaseAgent
 
+logger = logging.getLogger(__name__)
+
+# Prompt for the analysis call; fill with .format(resume_data=...)
+ANALYSIS_PROMPT = """Analyze this resume data and return a JSON object with the following structure:
+{{
+    "technical_skills": ["skill1", "skill2"],
+    "years_of_experience": number,
+    "education": {{
+        "level": "Bachelors/Masters/PhD",
+        "field": "field of study"
+    }},
+    "experience_level": "Junior/Mid-level/Senior",
+    "key_achievements": ["achievement1", "achievement2"],
+    "domain_expertise": ["domain1", "domain2"]
+}}
+
+Resume data:
+{resume_data}
+
+Return ONLY the JSON object, no other text.
+"""
+
 
 class AnalyzerAgent(BaseAgent):
     def __init__(self):
@@ -19,32 +42,14 @@ class AnalyzerAgent(BaseAgent):
 
     async def run(self, messages: list) -> Dict[str, Any]:
         """Analyze the extracted resume data"""
-        print("🔍 Analyzer: Analyzing candidate profile")
+        logger.debug("🔍 Analyzer: Analyzing candidate profile")
 
-        extracted_data = eval(messages[-1]["content"])
+        extracted_data = self._get_payload(messages)
 
         # Get structured analysis from Ollama
-        analysis_prompt = f"""
-        Analyze this resume data and return a JSON object with the following structure:
-        {{
-            "technical_skills": ["skill1", "skill2"],
-            "years_of_experience": number,
-            "education": {{
-                "level": "Bachelors/Masters/PhD",
-                "field": "field of study"
-            }},
-            "experience_level": "Junior/Mid-level/Senior",
-            "key_achievements": ["achievement1", "achievement2"],
-            "domain_expertise": ["domain1", "domain2"]
-        }}
-
-        Resume data:
-        {extracted_data["structured_data"]}
-
-        Return ONLY the JSON object, no other text.
-        """
-
-        analysis_results = self._query_ollama(analysis_prompt)
+        analysis_prompt = ANALYSIS_PROMPT.format(resume_data=extracted_data["structured_data"])
+
+        analysis_results = await self._aquery_ollama(analysis_prompt)
         parsed_results = self._parse_json_safely(analysis_results)
 
         # Ensure we have valid data even if parsing fails
@@ -1,23 +1,101 @@
 from typing import Dict, Any
+import asyncio
 import json
+import logging
+import threading
+import time
+import httpx
 from openai import OpenAI
+from utils.parsing import safe_parse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def _loads(text):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+# One client (and one keep-alive connection pool) to Ollama shared by every
+# agent, instead of a fresh client per agent instance.
+_OLLAMA_CLIENT = OpenAI(
+    base_url="http://localhost:11434/v1",
+    api_key="ollama",  # required but unused
+    # Generation can legitimately take a while, but a server that is down
+    # should fail on connect instead of hanging the request
+    timeout=httpx.Timeout(120.0, connect=2.0),
+    max_retries=1,
+    http_client=httpx.Client(
+        limits=httpx.Limits(
+            max_connections=32, max_keepalive_connections=32, keepalive_expiry=60
+        )
+    ),
+)
+
+# Circuit breaker: after this many consecutive failures Ollama calls fail
+# immediately for the cool-down period, then one call is let through to probe
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN_SECONDS = 30
+
+
+class _CircuitBreaker:
+    def __init__(self, threshold: int, cooldown: float):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """False while open; once the cool-down has passed, re-arms and lets one call probe."""
+        with self._lock:
+            if self._failures < self.threshold:
+                return True
+            now = time.monotonic()
+            if now < self._open_until:
+                return False
+            self._open_until = now + self.cooldown
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.threshold:
+                self._open_until = time.monotonic() + self.cooldown
+
+
+_OLLAMA_BREAKER = _CircuitBreaker(BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN_SECONDS)
 
 
 class BaseAgent:
     def __init__(self, name: str, instructions: str):
         self.name = name
         self.instructions = instructions
-        self.ollama_client = OpenAI(
-            base_url="http://localhost:11434/v1",
-            api_key="ollama",  # required but unused
-        )
+        self.ollama_client = _OLLAMA_CLIENT
 
     async def run(self, messages: list) -> Dict[str, Any]:
         """Default run method to be overridden by child classes"""
         raise NotImplementedError("Subclasses must implement run()")
 
+    def _get_payload(self, messages: list) -> Dict[str, Any]:
+        """Return the structured payload of the last message, parsing its content only as a fallback"""
+        message = messages[-1]
+        if "payload" in message:
+            return message["payload"]
+        return safe_parse(message.get("content", ""))
+
     def _query_ollama(self, prompt: str) -> str:
         """Query Ollama model with the given prompt"""
+        if not _OLLAMA_BREAKER.allow():
+            raise RuntimeError("Ollama unavailable: circuit open after repeated failures")
         try:
             response = self.ollama_client.chat.completions.create(
                 model="llama3.2",  # Updated to llama3.2
@@ -28,20 +106,35 @@ class BaseAgent:
                 temperature=0.7,
                 max_tokens=2000,
             )
-            return response.choices[0].message.content
         except Exception as e:
-            print(f"Error querying Ollama: {str(e)}")
+            _OLLAMA_BREAKER.record_failure()
+            logger.error("Error querying Ollama: %s", e)
             raise
+        _OLLAMA_BREAKER.record_success()
+        return response.choices[0].message.content
+
+    async def _aquery_ollama(self, prompt: str) -> str:
+        """Query Ollama from async code without blocking the event loop"""
+        return await asyncio.to_thread(self._query_ollama, prompt)
 
     def _parse_json_safely(self, text: str) -> Dict[str, Any]:
         """Safely parse JSON from text, handling potential errors"""
         try:
+            # Fast path: the model returned nothing but the JSON object
+            if text.lstrip().startswith("{"):
+                try:
+                    parsed = _loads(text)
+                    if isinstance(parsed, dict):
+                        return parsed
+                except json.JSONDecodeError:
+                    pass
+
             # Try to find JSON-like content between curly braces
             start = text.find("{")
             end = text.rfind("}")
             if start != -1 and end != -1:
                 json_str = text[start : end + 1]
-                return json.loads(json_str)
+                return _loads(json_str)
             return {"error": "No JSON content found"}
         except json.JSONDecodeError:
             return {"error": "Invalid JSON content"}
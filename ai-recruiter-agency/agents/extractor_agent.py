@@ -1,7 +1,10 @@
+import logging
 from typing import Dict, Any
-from pdfminer.high_level import extract_text # pip install pdfminer.six
 from .base_agent import BaseAgent
 
+logger = logging.getLogger(__name__)
+
+
 class ExtractorAgent(BaseAgent):
     def __init__(self):
         super().__init__(
@@ -13,18 +16,20 @@ class ExtractorAgent(BaseAgent):
     
     async def run(self, messages: list) -> Dict[str, Any]:
         """Process the resume and extract information"""
-        print("📄 Extractor: Processing resume")
+        logger.debug("📄 Extractor: Processing resume")
         
-        resume_data = eval(messages[-1]["content"])
+        resume_data = self._get_payload(messages)
         
         # Extract text from PDF
         if resume_data.get("file_path"):
+            # Imported here: pdfminer is slow to import and only needed for uploads
+            from pdfminer.high_level import extract_text # pip install pdfminer.six
             raw_text = extract_text(resume_data["file_path"])
         else:
             raw_text = resume_data.get("text", "")
 
         # Get structured information from Ollama
-        extracted_info = self._query_ollama(raw_text)
+        extracted_info = await self._aquery_ollama(raw_text)
 
         return {
             "raw_text": raw_text,
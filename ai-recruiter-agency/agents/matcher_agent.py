@@ -1,10 +1,111 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, FrozenSet, List
 from .base_agent import BaseAgent
+from utils.skills import skill_pattern, tokenize_skills
 try:
     from db.database import JobDatabase
 except Exception:
     JobDatabase = None
-import ast, json
+import functools
+from collections import defaultdict
+
+
+@functools.lru_cache(maxsize=1)
+def _get_job_db():
+    """Open the jobs database once per process instead of once per match."""
+    return JobDatabase()
+
+
+def build_job_index(organizations: List[Dict[str, Any]]):
+    """
+    Parse every posted job once and build the skill indexes used for scoring.
+    Returns (jobs, inverted, vocab): jobs is a list of (org, job, n_skills, bits),
+    inverted maps each skill to the positions in jobs that require it, and
+    vocab maps each skill to its bit / column number.
+    """
+    jobs = []
+    inverted = defaultdict(list)
+    vocab = {}
+    for org in organizations:
+        for job in org.get("jobs", []):
+            jd_skills = tokenize_skills(job.get("skills", ""))
+            pos = len(jobs)
+            bits = 0
+            for skill in jd_skills:
+                bits |= 1 << vocab.setdefault(skill, len(vocab))
+                inverted[skill].append(pos)
+            jobs.append((org, job, len(jd_skills), bits))
+    return jobs, inverted, vocab
+
+
+def skill_bits(skills: FrozenSet[str], vocab: Dict[str, int]) -> int:
+    """Encode a skill set as an int bitset over the job vocabulary."""
+    bits = 0
+    for skill in skills:
+        col = vocab.get(skill)
+        if col is not None:
+            bits |= 1 << col
+    return bits
+
+
+def score_row(skills: FrozenSet[str], index) -> List[float]:
+    """Overlap score for every job position: popcount(student & job) / job size."""
+    jobs, _, vocab = index
+    s_bits = skill_bits(skills, vocab)
+    return [(s_bits & bits).bit_count() / max(1, n) for _, _, n, bits in jobs]
+
+
+@functools.lru_cache(maxsize=1)
+def _sparse_backend():
+    """
+    Import numpy/scipy on first batch use rather than at module import:
+    they add noticeable start-up time and single-profile matching never needs them.
+    Returns (numpy, scipy.sparse), or None if they are not installed.
+    """
+    try:
+        import numpy
+        from scipy import sparse
+    except ImportError:
+        return None
+    return numpy, sparse
+
+
+def score_matrix(skill_lists: List[FrozenSet[str]], index):
+    """
+    Overlap scores for a batch of students: row i, column pos is the score of
+    student i for job position pos. Batches go through one sparse
+    student x skill @ skill x job product when numpy/scipy are installed;
+    otherwise (or for a single student) each row comes from score_row.
+    """
+    jobs, inverted, vocab = index
+    backend = _sparse_backend() if len(skill_lists) >= 2 and inverted else None
+    if backend is None:
+        return [score_row(skills, index) for skills in skill_lists]
+    np, sparse = backend
+
+    rows, cols = [], []
+    for skill, positions in inverted.items():
+        rows.extend(positions)
+        cols.extend([vocab[skill]] * len(positions))
+    job_mat = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(jobs), len(vocab))
+    )
+
+    rows, cols = [], []
+    for i, skills in enumerate(skill_lists):
+        for skill in skills:
+            col = vocab.get(skill)
+            if col is not None:
+                rows.append(i)
+                cols.append(col)
+    student_mat = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, cols)), shape=(len(skill_lists), len(vocab))
+    )
+
+    job_len = np.array([max(1, n) for _, _, n, _ in jobs], dtype=float)
+    overlap = (student_mat @ job_mat.T).toarray()
+    return overlap / job_len
+
+
 class MatcherAgent(BaseAgent):
     def __init__(self):
         super().__init__(
@@ -23,17 +124,7 @@ class MatcherAgent(BaseAgent):
         if not messages:
             return {"matches": []}
 
-        raw = messages[-1].get("content", "")
-        payload = None
-
-        # Parse string → dict
-        try:
-            payload = json.loads(raw)
-        except Exception:
-            try:
-                payload = ast.literal_eval(raw)
-            except Exception:
-                payload = {"text": raw}
+        payload = self._get_payload(messages)
 
         matches = []
 
@@ -42,19 +133,23 @@ class MatcherAgent(BaseAgent):
             profile = payload["profile"]
             organizations = payload["organizations"]
 
-            skills = [s.strip().lower() for s in profile.get("skills", "").split(",") if s.strip()]
-            for org in organizations:
-                for job in org.get("jobs", []):
-                    jd_skills = [s.strip().lower() for s in job.get("skills", "").split(",") if s.strip()]
-                    if not jd_skills:
-                        continue
-                    score = len(set(skills) & set(jd_skills)) / max(1, len(jd_skills))
-                    matches.append({
-                        "student": profile.get("name", "Unknown"),
-                        "organization": org.get("org_name", "Unknown"),
-                        "job": job.get("title", "Unknown"),
-                        "score": f"{int(score*100)}%"
-                    })
+            skills = tokenize_skills(profile.get("skills", ""))
+            if not skills:
+                return {"matches": []}
+
+            index = build_job_index(organizations)
+            scores = score_matrix([skills], index)[0]
+            name = profile.get("name", "Unknown")
+            matches = [
+                {
+                    "student": name,
+                    "organization": org.get("org_name", "Unknown"),
+                    "job": job.get("title", "Unknown"),
+                    "score": f"{int(score*100)}%"
+                }
+                for (org, job, n_skills, _), score in zip(index[0], scores)
+                if n_skills
+            ]
             return {"matches": matches}
 
         # Case 2: Resume pipeline (extracted_info)
@@ -62,20 +157,37 @@ class MatcherAgent(BaseAgent):
             extracted = payload.get("extracted_info", {})
             skills = extracted.get("skills", [])
             if isinstance(skills, str):
-                skills = [s.strip().lower() for s in skills.split(",") if s.strip()]
+                skills = sorted(tokenize_skills(skills))
+            else:
+                skills = sorted({t for s in skills for t in tokenize_skills(str(s))})
 
             if JobDatabase and skills:
                 try:
-                    db = JobDatabase()
-                    for skill in skills:
-                        rows = db.search_jobs(skill, experience_level="")
-                        for r in rows:
-                            matches.append({
-                                "student": extracted.get("name", "Unknown"),
-                                "organization": r.get("company", "Unknown"),
-                                "job": r.get("title", "Unknown"),
-                                "score": "50%"
-                            })
+                    rows = _get_job_db().search_jobs_bulk(skills)
+                    patterns = [skill_pattern(skill) for skill in skills]
+                    # The same posting can be stored more than once; keep
+                    # one match per (company, title), the best scoring one
+                    best = {}
+                    for r in rows:
+                        reqs = [str(req) for req in r.get("requirements", [])]
+                        # Share of the job's requirements that name one of the
+                        # candidate's skills as a whole term. The LIKE prefilter
+                        # also returns substring hits ("c" in "Cybersecurity"),
+                        # which score 0 here and are dropped.
+                        hits = sum(1 for req in reqs if any(p.search(req) for p in patterns))
+                        if not hits:
+                            continue
+                        score = min(1.0, hits / len(reqs))
+                        key = (r.get("company", "Unknown"), r.get("title", "Unknown"))
+                        if key not in best or score > best[key][0]:
+                            best[key] = (score, r)
+                    for (company, title), (score, r) in best.items():
+                        matches.append({
+                            "student": extracted.get("name", "Unknown"),
+                            "organization": company,
+                            "job": title,
+                            "score": f"{int(score*100)}%"
+                        })
                 except Exception:
                     pass
 
@@ -1,10 +1,29 @@
+import asyncio
+import heapq
+import logging
 from typing import Dict, Any
 from .base_agent import BaseAgent
 from .extractor_agent import ExtractorAgent
 from .analyzer_agent import AnalyzerAgent
-from .matcher_agent import MatcherAgent
+from .matcher_agent import MatcherAgent, build_job_index, score_matrix
 from .screener_agent import ScreenerAgent
 from .recommender_agent import RecommenderAgent
+from utils.skills import tokenize_skills
+
+logger = logging.getLogger(__name__)
+
+# Only the best few job matches go into the screener/recommender prompts;
+# every extra match is prompt tokens the LLM has to read
+PROMPT_TOP_MATCHES = 5
+
+
+def _top_matches(job_matches: Dict[str, Any], n: int = PROMPT_TOP_MATCHES) -> Dict[str, Any]:
+    """Return job_matches with its "matches" list cut down to the n best scores."""
+    matches = job_matches.get("matches") if isinstance(job_matches, dict) else None
+    if not matches or len(matches) <= n:
+        return job_matches
+    best = heapq.nlargest(n, matches, key=lambda m: int(str(m.get("score", "0")).rstrip("%") or 0))
+    return {**job_matches, "matches": best}
 
 
 class OrchestratorAgent(BaseAgent):
@@ -31,18 +50,20 @@ class OrchestratorAgent(BaseAgent):
 
     def process_profile(self, student_profile, organizations):
         """Match a student profile (no resume) to org jobs."""
-        skills = student_profile.get("skills", "").split(",")
+        skills = tokenize_skills(student_profile.get("skills", ""))
+        if not skills:
+            return None
+
+        index = build_job_index(organizations)
+        scores = score_matrix([skills], index)[0]
         matches = []
-        for org in organizations:
-            for job in org.get("jobs", []):
-                jd_skills = job["skills"].split(",")
-                score = len(set(skills) & set(jd_skills)) / max(1, len(jd_skills))
-                matches.append({
-                    "student": student_profile["name"],
-                    "organization": org["org_name"],
-                    "job": job["title"],
-                    "score": f"{score:.0%}"
-                })
+        for pos, (org, job, _, _) in enumerate(index[0]):
+            matches.append({
+                "student": student_profile["name"],
+                "organization": org["org_name"],
+                "job": job["title"],
+                "score": f"{scores[pos]:.0%}"
+            })
         best = max(matches, key=lambda x: float(x["score"].strip("%")), default=None)
         return best
 
@@ -50,12 +71,28 @@ class OrchestratorAgent(BaseAgent):
     async def run(self, messages: list) -> Dict[str, Any]:
         """Process a single message through the agent"""
         prompt = messages[-1]["content"]
-        response = self._query_ollama(prompt)
+        response = await self._aquery_ollama(prompt)
         return self._parse_json_safely(response)
 
+    def _extracted_info(self, extracted_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Name and skills for the matcher, taken from the extractor's structured
+        output when the model returned it as JSON; empty otherwise.
+        """
+        structured = extracted_data.get("structured_data")
+        if isinstance(structured, str):
+            structured = self._parse_json_safely(structured)
+        if not isinstance(structured, dict) or "error" in structured:
+            return {}
+
+        personal = structured.get("personal_info")
+        name = structured.get("name") or (personal.get("name") if isinstance(personal, dict) else None)
+        skills = structured.get("skills") or structured.get("technical_skills") or []
+        return {"name": name or "Unknown", "skills": skills}
+
     async def process_application(self, resume_data: Dict[str, Any]) -> Dict[str, Any]:
         """Main workflow orchestrator for processing job applications"""
-        print("🎯 Orchestrator: Starting application process")
+        logger.debug("🎯 Orchestrator: Starting application process")
 
         workflow_context = {
             "resume_data": resume_data,
@@ -66,31 +103,45 @@ class OrchestratorAgent(BaseAgent):
         try:
             # Extract resume information
             extracted_data = await self.extractor.run(
-                [{"role": "user", "content": str(resume_data)}]
+                [{"role": "user", "content": "", "payload": resume_data}]
             )
             workflow_context.update(
                 {"extracted_data": extracted_data, "current_stage": "analysis"}
             )
 
-            # Analyze candidate profile
-            analysis_results = await self.analyzer.run(
-                [{"role": "user", "content": str(extracted_data)}]
+            # Analyze candidate profile and match with jobs; both only need
+            # the extractor output, so run them side by side
+            analysis_results, job_matches = await asyncio.gather(
+                self.analyzer.run([{"role": "user", "content": "", "payload": extracted_data}]),
+                self.matcher.run(
+                    [
+                        {
+                            "role": "user",
+                            "content": "",
+                            "payload": {"extracted_info": self._extracted_info(extracted_data)},
+                        }
+                    ]
+                ),
             )
             workflow_context.update(
-                {"analysis_results": analysis_results, "current_stage": "matching"}
+                {
+                    "analysis_results": analysis_results,
+                    "job_matches": job_matches,
+                    "current_stage": "screening",
+                }
             )
 
-            # Match with jobs
-            job_matches = await self.matcher.run(
-                [{"role": "user", "content": str(analysis_results)}]
-            )
-            workflow_context.update(
-                {"job_matches": job_matches, "current_stage": "screening"}
-            )
+            # Screener and recommender only see the stage outputs they use,
+            # not the whole (raw text, resume path, status) workflow context
+            screening_inputs = {
+                "extracted_profile": extracted_data.get("structured_data"),
+                "analysis_results": analysis_results,
+                "job_matches": _top_matches(job_matches),
+            }
 
             # Screen candidate
             screening_results = await self.screener.run(
-                [{"role": "user", "content": str(workflow_context)}]
+                [{"role": "user", "content": "", "payload": screening_inputs}]
             )
             workflow_context.update(
                 {
@@ -101,7 +152,16 @@ class OrchestratorAgent(BaseAgent):
 
             # Generate recommendations
             final_recommendation = await self.recommender.run(
-                [{"role": "user", "content": str(workflow_context)}]
+                [
+                    {
+                        "role": "user",
+                        "content": "",
+                        "payload": {
+                            **screening_inputs,
+                            "screening_results": screening_results,
+                        },
+                    }
+                ]
             )
             workflow_context.update(
                 {"final_recommendation": final_recommendation, "status": "completed"}
@@ -110,6 +170,7 @@ class OrchestratorAgent(BaseAgent):
             return workflow_context
 
         except Exception as e:
+            logger.error("Orchestrator failed at stage %s: %s", workflow_context["current_stage"], e)
             workflow_context.update({"status": "failed", "error": str(e)})
             raise
 
@@ -118,13 +179,31 @@ class OrchestratorAgent(BaseAgent):
 # Synchronous wrapper for the async OrchestratorAgent
 # Adds a stable, simple interface: Orchestrator.process_resume(path)
 # and Orchestrator.process_profile(profile, orgs)
-import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
 from typing import List, Dict, Any
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# Result cache for the sync wrapper: bounded LRU whose entries expire so that
+# edited job postings are picked up again.
+CACHE_MAX_ENTRIES = 512
+CACHE_TTL_SECONDS = 600
+
+
 class Orchestrator:
     """
     Lightweight synchronous wrapper around OrchestratorAgent.
-    It attempts to call the async agent.run(...) via asyncio.run.
+    It submits the async agent.run(...) to a persistent background event loop,
+    so repeated calls reuse one loop instead of paying asyncio.run's setup/teardown.
     If that fails it falls back to a simple skills-overlap heuristic for process_profile.
     """
     def __init__(self):
@@ -134,12 +213,110 @@ class Orchestrator:
         except Exception:
             self.agent = None
 
+        # uvloop's loop is a drop-in, faster replacement where it is available
+        self._loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+        self._cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # key -> Future for computations still running, so concurrent identical
+        # requests (e.g. a double-clicked button) wait on the first one
+        self._inflight = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._cache_coalesced = 0
+
+    def _run(self, coro):
+        """Run a coroutine on the background loop and block for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _cache_get(self, key):
+        """Return a cached result, or None if missing or expired."""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > CACHE_TTL_SECONDS:
+                del self._cache[key]
+                return None
+            self._cache.move_to_end(key)
+            return value
+
+    def _cache_put(self, key, value):
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic(), value)
+            self._cache.move_to_end(key)
+            while len(self._cache) > CACHE_MAX_ENTRIES:
+                self._cache.popitem(last=False)
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Result-cache counters: hits, misses (calls that ran the computation),
+        coalesced (calls that waited on an identical in-flight computation),
+        plus current size and in-flight count.
+        """
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "coalesced": self._cache_coalesced,
+                "size": len(self._cache),
+                "inflight": len(self._inflight),
+            }
+
+    def _get_or_compute(self, key, compute, should_cache=None):
+        """Serve key from the cache; concurrent misses for the same key share one compute() call."""
+        cached = self._cache_get(key)
+        with self._cache_lock:
+            if cached is not None:
+                self._cache_hits += 1
+                return cached
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                self._cache_misses += 1
+                future = self._inflight[key] = concurrent.futures.Future()
+            else:
+                self._cache_coalesced += 1
+        if not owner:
+            return future.result()
+
+        try:
+            result = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            if should_cache is None or should_cache(result):
+                self._cache_put(key, result)
+            future.set_result(result)
+            return result
+        finally:
+            with self._cache_lock:
+                self._inflight.pop(key, None)
+
     def process_resume(self, resume_path: str) -> Dict[str, Any]:
         """Process a resume file (path) through the async orchestrator. Returns a dict result."""
-        messages = [{"role": "user", "content": str({"file_path": resume_path})}]
+        key = None
+        try:
+            with open(resume_path, "rb") as f:
+                key = ("resume", hashlib.sha256(f.read()).digest())
+        except OSError:
+            pass
+        if key is None:
+            return self._process_resume(resume_path)
+        return self._get_or_compute(
+            key,
+            lambda: self._process_resume(resume_path),
+            should_cache=lambda result: result.get("status") != "failed" and "error" not in result,
+        )
+
+    def _process_resume(self, resume_path: str) -> Dict[str, Any]:
+        messages = [{"role": "user", "content": json.dumps({"file_path": resume_path})}]
         if self.agent is not None:
             try:
-                return asyncio.run(self.agent.run(messages))
+                return self._run(self.agent.run(messages))
             except Exception as e:
                 return {"status": "failed", "error": f"OrchestratorAgent.run failed: {e}"}
         else:
@@ -148,30 +325,76 @@ class Orchestrator:
     def process_profile(self, student_profile: Dict[str, Any], organizations: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Guarantee return: {"matches": [ ... ]}
+        Identical (profile, organizations) inputs are served from the result cache.
         """
-        results = []
+        # Serialize once: the same text keys the cache and is sent to the agent.
+        content = json.dumps(
+            {"profile": student_profile, "organizations": organizations},
+            sort_keys=True,
+            default=str,
+        )
+        key = ("profile", hashlib.blake2b(content.encode()).digest())
+        # Only agent answers are cached: a heuristic fallback (Ollama down) or
+        # an unparseable answer should be retried once the model is back
+        result, from_agent = self._get_or_compute(
+            key,
+            lambda: self._process_profile(student_profile, organizations, content),
+            should_cache=lambda outcome: outcome[1],
+        )
+        return result
 
+    def _process_profile(self, student_profile: Dict[str, Any], organizations: List[Dict[str, Any]], content: str):
+        """Return (result, from_agent); from_agent is False for fallback and error results."""
         if self.agent is not None:
             try:
-                messages = [{"role": "user", "content": str({"profile": student_profile, "organizations": organizations})}]
-                res = asyncio.run(self.agent.run(messages))
+                messages = [{"role": "user", "content": content}]
+                res = self._run(self.agent.run(messages))
                 if isinstance(res, dict) and "matches" in res:
-                    return res
+                    return res, True
                 if isinstance(res, dict):
-                    return {"matches": [res]}
+                    return {"matches": [res]}, "error" not in res
             except Exception:
                 pass
 
         # Heuristic fallback
-        skills = [s.strip().lower() for s in student_profile.get("skills", "").split(",") if s.strip()]
-        for org in organizations:
-            for job in org.get("jobs", []):
-                jd_skills = [s.strip().lower() for s in job.get("skills", "").split(",") if s.strip()]
-                score = len(set(skills) & set(jd_skills)) / max(1, len(jd_skills))
-                results.append({
-                    "student": student_profile.get("name"),
-                    "organization": org.get("org_name"),
-                    "job": job.get("title"),
-                    "score": f"{int(score*100)}%"
-                })
-        return {"matches": results}
+        return {"matches": self._heuristic_matches([student_profile], organizations)}, False
+
+    def process_cohort(self, students: List[Dict[str, Any]], organizations: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Match a whole cohort with the skills-overlap heuristic in one pass:
+        jobs are indexed once and all students are scored together.
+        Guarantee return: {"matches": [ ... ]}
+        """
+        return {"matches": self._heuristic_matches(students, organizations)}
+
+    def _heuristic_matches(self, students: List[Dict[str, Any]], organizations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Skills-overlap matches for every (student, job) pair; students without skills are skipped."""
+        cohort = []
+        for student in students:
+            skills = tokenize_skills(student.get("skills", ""))
+            if skills:
+                cohort.append((student, skills))
+        if not cohort:
+            return []
+
+        index = build_job_index(organizations)
+        scores = score_matrix([skills for _, skills in cohort], index)
+        # Job labels don't depend on the student; resolve them once
+        labels = [(org.get("org_name"), job.get("title")) for org, job, _, _ in index[0]]
+        names = [student.get("name") for student, _ in cohort]
+        return [
+            {
+                "student": name,
+                "organization": org_name,
+                "job": title,
+                "score": f"{int(score*100)}%"
+            }
+            for name, row in zip(names, scores)
+            for (org_name, title), score in zip(labels, row)
+        ]
+
+
+@functools.lru_cache(maxsize=1)
+def get_orchestrator() -> Orchestrator:
+    """Return the process-wide Orchestrator, building its agents and event loop on first use."""
+    return Orchestrator()
@@ -1,6 +1,10 @@
+import json
+import logging
 from typing import Dict, Any
 from .base_agent import BaseAgent
 
+logger = logging.getLogger(__name__)
+
 
 class RecommenderAgent(BaseAgent):
     def __init__(self):
@@ -16,10 +20,10 @@ class RecommenderAgent(BaseAgent):
 
     async def run(self, messages: list) -> Dict[str, Any]:
         """Generate final recommendations"""
-        print("💡 Recommender: Generating final recommendations")
+        logger.debug("💡 Recommender: Generating final recommendations")
 
-        workflow_context = eval(messages[-1]["content"])
-        recommendation = self._query_ollama(str(workflow_context))
+        workflow_context = self._get_payload(messages)
+        recommendation = await self._aquery_ollama(json.dumps(workflow_context, default=str))
 
         return {
             "final_recommendation": recommendation,
@@ -1,6 +1,10 @@
+import json
+import logging
 from typing import Dict, Any
 from .base_agent import BaseAgent
 
+logger = logging.getLogger(__name__)
+
 
 class ScreenerAgent(BaseAgent):
     def __init__(self):
@@ -17,10 +21,10 @@ class ScreenerAgent(BaseAgent):
 
     async def run(self, messages: list) -> Dict[str, Any]:
         """Screen the candidate"""
-        print("👥 Screener: Conducting initial screening")
+        logger.debug("👥 Screener: Conducting initial screening")
 
-        workflow_context = eval(messages[-1]["content"])
-        screening_results = self._query_ollama(str(workflow_context))
+        workflow_context = self._get_payload(messages)
+        screening_results = await self._aquery_ollama(json.dumps(workflow_context, default=str))
 
         return {
             "screening_report": screening_results,
@@ -1,8 +1,12 @@
 import streamlit as st
 from ui import apply_theme, render_header
+from utils.logger import setup_logger
 
 st.set_page_config(page_title="AI Internship Allocation System", layout="wide")
 
+# Once per process; later reruns find the handler already installed
+setup_logger()
+
 # Theme
 apply_theme()
 render_header("PM Internship Allocation", "AI-powered fair internship matching")
@@ -2,7 +2,25 @@ import sqlite3
 from pathlib import Path
 from typing import Dict, List, Any
 import json
+import logging
 import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def _like_contains(text: str) -> str:
+    """LIKE pattern for "contains text", with %, _ and the escape char taken literally"""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+# Prepared statements kept on the shared connection; the skill searches
+# produce one SQL text per number of skills searched, and all share this cache
+STATEMENT_CACHE_SIZE = 256
+
+# Database files whose schema has already been applied in this process
+_INITIALIZED_PATHS = set()
 
 
 class JobDatabase:
@@ -11,18 +29,28 @@ class JobDatabase:
         current_dir = Path(__file__).parent
         self.db_path = current_dir / "jobs.sqlite"
         self.schema_path = current_dir / "schema.sql"
+        # One connection for the life of the object instead of a connect()
+        # per query; the lock serializes use across threads
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
         self._init_db()
 
     def _init_db(self):
         """Initialize the database with schema"""
+        if self.db_path in _INITIALIZED_PATHS:
+            return
         if not self.schema_path.exists():
             raise FileNotFoundError(f"Schema file not found at {self.schema_path}")
 
         with open(self.schema_path) as f:
             schema = f.read()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript(schema)
+        with self._lock:
+            self._conn.executescript(schema)
+        _INITIALIZED_PATHS.add(self.db_path)
 
     def add_job(self, job_data: Dict[str, Any]) -> int:
         """Add a new job to the database"""
@@ -33,7 +61,7 @@ class JobDatabase:
         ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             cursor = conn.cursor()
             cursor.execute(
                 query,
@@ -55,28 +83,25 @@ class JobDatabase:
         """Retrieve all jobs from the database"""
         query = "SELECT * FROM jobs ORDER BY created_at DESC"
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute(query)
-            rows = cursor.fetchall()
-
-            return [
-                {
-                    "id": row["id"],
-                    "title": row["title"],
-                    "company": row["company"],
-                    "location": row["location"],
-                    "type": row["type"],
-                    "experience_level": row["experience_level"],
-                    "salary_range": row["salary_range"],
-                    "description": row["description"],
-                    "requirements": json.loads(row["requirements"]),
-                    "benefits": json.loads(row["benefits"]) if row["benefits"] else [],
-                    "created_at": row["created_at"],
-                }
-                for row in rows
-            ]
+        with self._lock:
+            rows = self._conn.execute(query).fetchall()
+
+        return [
+            {
+                "id": row["id"],
+                "title": row["title"],
+                "company": row["company"],
+                "location": row["location"],
+                "type": row["type"],
+                "experience_level": row["experience_level"],
+                "salary_range": row["salary_range"],
+                "description": row["description"],
+                "requirements": json.loads(row["requirements"]),
+                "benefits": json.loads(row["benefits"]) if row["benefits"] else [],
+                "created_at": row["created_at"],
+            }
+            for row in rows
+        ]
 
     def search_jobs(
         self, skills: List[str], experience_level: str
@@ -92,39 +117,76 @@ class JobDatabase:
 
         # Create LIKE conditions for each skill
         for skill in skills:
-            query_conditions.append("requirements LIKE ?")
-            params.append(f"%{skill}%")
+            query_conditions.append("requirements LIKE ? ESCAPE '\\'")
+            params.append(_like_contains(skill))
 
         query += " OR ".join(query_conditions) + ")"
 
         try:
-            with sqlite3.connect(self.db.db_path) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-                cursor.execute(query, params)
-                rows = cursor.fetchall()
-
-                return [
-                    {
-                        "id": row["id"],
-                        "title": row["title"],
-                        "company": row["company"],
-                        "location": row["location"],
-                        "type": row["type"],
-                        "experience_level": row["experience_level"],
-                        "salary_range": row["salary_range"],
-                        "description": row["description"],
-                        "requirements": json.loads(row["requirements"]),
-                        "benefits": (
-                            json.loads(row["benefits"]) if row["benefits"] else []
-                        ),
-                    }
-                    for row in rows
-                ]
+            with self._lock:
+                rows = self._conn.execute(query, params).fetchall()
+
+            return [
+                {
+                    "id": row["id"],
+                    "title": row["title"],
+                    "company": row["company"],
+                    "location": row["location"],
+                    "type": row["type"],
+                    "experience_level": row["experience_level"],
+                    "salary_range": row["salary_range"],
+                    "description": row["description"],
+                    "requirements": json.loads(row["requirements"]),
+                    "benefits": (
+                        json.loads(row["benefits"]) if row["benefits"] else []
+                    ),
+                }
+                for row in rows
+            ]
+        except Exception as e:
+            logger.error("Error searching jobs: %s", e)
+            return []
+
+    def search_jobs_bulk(self, skills: List[str]) -> List[Dict[str, Any]]:
+        """Find jobs whose requirements mention any of the skills, in one query"""
+        if not skills:
+            return []
+
+        query = "SELECT * FROM jobs WHERE " + " OR ".join(
+            ["requirements LIKE ? ESCAPE '\\'"] * len(skills)
+        )
+        params = [_like_contains(skill) for skill in skills]
+
+        try:
+            with self._lock:
+                rows = self._conn.execute(query, params).fetchall()
+
+            return [
+                {
+                    "id": row["id"],
+                    "title": row["title"],
+                    "company": row["company"],
+                    "location": row["location"],
+                    "type": row["type"],
+                    "experience_level": row["experience_level"],
+                    "salary_range": row["salary_range"],
+                    "description": row["description"],
+                    "requirements": json.loads(row["requirements"]),
+                    "benefits": (
+                        json.loads(row["benefits"]) if row["benefits"] else []
+                    ),
+                }
+                for row in rows
+            ]
         except Exception as e:
-            print(f"Error searching jobs: {e}")
+            logger.error("Error searching jobs: %s", e)
             return []
 
+    def close(self):
+        """Close the underlying connection"""
+        with self._lock:
+            self._conn.close()
+
 
 # import sqlite3
 # from pathlib import Path
@@ -1,17 +1,15 @@
-import streamlit as st, json, os
+import streamlit as st
 from ui import apply_theme, render_header
+from utils.storage import load_records, append_record
 
-DATA_PATH = "data/students.json"
+DATA_PATH = "data/students.jsonl"
 
 st.set_page_config(page_title="Student Portal", layout="wide")
 apply_theme()
 render_header("Student Portal", "Register, create profile, apply internships")
 
 # Load DB
-if os.path.exists(DATA_PATH):
-    with open(DATA_PATH, "r") as f: students = json.load(f)
-else:
-    students = []
+students = load_records(DATA_PATH)
 
 st.markdown("### 🧑‍🎓 Student Registration / Login")
 with st.form("student_register"):
@@ -24,9 +22,9 @@ with st.form("student_register"):
     if submitted:
         profile = {"name": name, "email": email, "education": education, "skills": skills, "preferences": preferences}
         students.append(profile)
-        with open(DATA_PATH, "w") as f: json.dump(students, f, indent=2)
+        append_record(DATA_PATH, profile)
         st.success(f"Profile for {name} saved!")
 
 st.markdown("### 📄 Applied Students")
 if students:
-    st.table(students)
+    st.dataframe(students, use_container_width=True, hide_index=True)
@@ -1,16 +1,14 @@
-import streamlit as st, json, os
+import streamlit as st
 from ui import apply_theme, render_header
+from utils.storage import load_organizations, append_record
 
-DATA_PATH = "data/organizations.json"
+DATA_PATH = "data/organizations.jsonl"
 
 st.set_page_config(page_title="Organization Portal", layout="wide")
 apply_theme()
 render_header("Organization Portal", "Post job descriptions, view applicants")
 
-if os.path.exists(DATA_PATH):
-    with open(DATA_PATH, "r") as f: orgs = json.load(f)
-else:
-    orgs = []
+orgs = load_organizations(DATA_PATH)
 
 st.markdown("### 🏢 Organization Registration")
 with st.form("org_register"):
@@ -21,7 +19,7 @@ with st.form("org_register"):
     if submitted:
         org = {"org_name": org_name, "email": email, "location": location, "jobs": []}
         orgs.append(org)
-        with open(DATA_PATH, "w") as f: json.dump(orgs, f, indent=2)
+        append_record(DATA_PATH, org)
         st.success(f"Organization {org_name} saved!")
 
 st.markdown("### 📌 Post Job Descriptions")
@@ -33,12 +31,13 @@ with st.form("job_post"):
     jd_submit = st.form_submit_button("Post Job")
     if jd_submit:
         if orgs:
-            orgs[-1]["jobs"].append({"title": jd_title, "skills": jd_skills, "type": jd_type, "location": jd_location})
-            with open(DATA_PATH, "w") as f: json.dump(orgs, f, indent=2)
+            job = {"title": jd_title, "skills": jd_skills, "type": jd_type, "location": jd_location}
+            orgs[-1]["jobs"].append(job)
+            append_record(DATA_PATH, {"job": job})
             st.success(f"Job '{jd_title}' posted!")
         else:
             st.warning("Please register an organization first!")
 
 st.markdown("### 📋 Registered Organizations")
 if orgs:
-    st.table(orgs)
+    st.dataframe(orgs, use_container_width=True, hide_index=True)
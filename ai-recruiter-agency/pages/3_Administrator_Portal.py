@@ -1,5 +1,6 @@
 import streamlit as st
 from ui import apply_theme, render_header, page_section
+from agents.orchestrator import get_orchestrator
 
 st.set_page_config(page_title="Administrator Portal", layout="wide")
 apply_theme()
@@ -10,6 +11,20 @@ st.metric("Total Students", 120)
 st.metric("Total Organizations", 35)
 st.metric("Jobs Posted", 50)
 
+st.markdown("### ⚡ AI Result Cache")
+stats = get_orchestrator().cache_stats()
+for col, (label, value) in zip(
+    st.columns(5),
+    [
+        ("Hits", stats["hits"]),
+        ("Misses", stats["misses"]),
+        ("Coalesced", stats["coalesced"]),
+        ("Cached Results", stats["size"]),
+        ("In Flight", stats["inflight"]),
+    ],
+):
+    col.metric(label, value)
+
 st.markdown("---")
 
 st.markdown("### ✅ Approve / Override Matches")
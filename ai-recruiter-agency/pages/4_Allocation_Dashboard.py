@@ -1,20 +1,23 @@
 import streamlit as st
-import json, os
+import os
 from ui import apply_theme, render_header, page_section
-from agents.orchestrator import Orchestrator
+from agents.orchestrator import get_orchestrator
 from utils.parsing import safe_parse
+from utils.storage import load_records, load_organizations
 
 st.set_page_config(page_title="Allocation Dashboard", layout="wide")
 apply_theme()
 render_header("AI Allocation", "Skill matching & automated allocation")
 
-orch = Orchestrator()
 
-students_path = os.path.join("data", "students.json")
-orgs_path = os.path.join("data", "organizations.json")
+# Shared with the other pages so the agents and event loop are built once per process
+orch = get_orchestrator()
 
-students = json.load(open(students_path)) if os.path.exists(students_path) else []
-orgs = json.load(open(orgs_path)) if os.path.exists(orgs_path) else []
+students_path = os.path.join("data", "students.jsonl")
+orgs_path = os.path.join("data", "organizations.jsonl")
+
+students = load_records(students_path)
+orgs = load_organizations(orgs_path)
 
 st.markdown("### AI Allocation Dashboard")
 st.write("Students:", len(students), " | Organizations:", len(orgs))
@@ -26,10 +29,7 @@ if st.button("Run Allocation"):
         st.warning("No students or organizations registered. Add some first.")
     else:
         with st.spinner("Running AI allocation..."):
-            results = []
-            for s in students:
-                parsed = orch.process_profile(s, orgs)
-                results.extend(parsed.get("matches", []))
+            results = orch.process_cohort(students, orgs).get("matches", [])
 
         if results:
             page_section("Allocation Results", lambda: st.dataframe(results))
@@ -1,14 +1,16 @@
 import streamlit as st
 import os, json
 from ui import apply_theme, render_header, page_section
-from agents.orchestrator import Orchestrator
+from agents.orchestrator import get_orchestrator
 from utils.parsing import safe_parse
 
 st.set_page_config(page_title="Resume Analysis", layout="wide")
 apply_theme()
 render_header("Resume Analysis", "Upload resumes and analyze with AI pipeline")
 
-orch = Orchestrator()
+
+# Shared with the other pages so the agents and event loop are built once per process
+orch = get_orchestrator()
 
 uploaded_file = st.file_uploader("Upload a resume (PDF/TXT)", type=["pdf", "txt"])
 
@@ -21,20 +23,12 @@ if uploaded_file:
 
     if not result:
         st.error("Pipeline returned empty result.")
-    else:
-        for k, v in result.items():
-        # Use json for dicts, write otherwise
-         if isinstance(v, (dict, list)):
-            page_section(str(k), lambda vv=v: st.json(vv))
-         else:
-            page_section(str(k), lambda vv=v: st.write(vv))
-
-    if not isinstance(result, dict):
+    elif not isinstance(result, dict):
         st.error("Pipeline returned unexpected result format.")
     else:
-        # Safe display: iterate keys
         for k, v in result.items():
-            try:
+            # Use json for dicts, write otherwise
+            if isinstance(v, (dict, list)):
+                page_section(str(k), lambda vv=v: st.json(vv))
+            else:
                 page_section(str(k), lambda vv=v: st.write(vv))
-            except Exception:
-                st.write(f"{k}: {v}")
@@ -1,9 +1,9 @@
 import streamlit as st
+from html import escape
 from textwrap import dedent
 
-def apply_theme():
-    """Inject premium CSS theme."""
-    st.markdown(dedent("""
+# Theme markup never changes, so build it once at import instead of on every rerun
+_THEME_CSS = dedent("""
     <style>
     .stApp {
         background: linear-gradient(180deg, #0f172a 0%, #071133 100%);
@@ -35,7 +35,12 @@ def apply_theme():
         font-weight: 600;
     }
     </style>
-    """), unsafe_allow_html=True)
+    """)
+
+
+def apply_theme():
+    """Inject premium CSS theme."""
+    st.markdown(_THEME_CSS, unsafe_allow_html=True)
 
 
 def render_header(title="AI Recruiter", tagline="Smarter Resume Analysis"):
@@ -43,8 +48,8 @@ def render_header(title="AI Recruiter", tagline="Smarter Resume Analysis"):
     st.markdown(f"""
     <div class="premium-header">
         <div style="flex:1">
-            <div class="premium-title">{title}</div>
-            <div class="premium-sub">{tagline}</div>
+            <div class="premium-title">{escape(title)}</div>
+            <div class="premium-sub">{escape(tagline)}</div>
         </div>
         <div style="display:flex;gap:8px;">
             <button class="stButton">New Session</button>
@@ -69,6 +74,7 @@ def render_sidebar(default="Upload Resume"):
 
 def page_section(title, render_fn=None):
     """Reusable styled section card."""
-    st.markdown(f"<div class='card'><h4>{title}</h4>", unsafe_allow_html=True)
+    # Titles can come from model output (e.g. result keys), so escape them
+    st.markdown(f"<div class='card'><h4>{escape(str(title))}</h4>", unsafe_allow_html=True)
     if render_fn: render_fn()
     st.markdown("</div>", unsafe_allow_html=True)
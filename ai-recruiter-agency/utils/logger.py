@@ -1,10 +1,19 @@
+import atexit
 import logging
+import logging.handlers
+import queue
 from datetime import datetime
 import os
 
 
 def setup_logger():
     """Setup application logging"""
+    # Already set up (e.g. a Streamlit rerun): don't add another handler,
+    # listener thread and log file, or every record gets written twice
+    root = logging.getLogger()
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in root.handlers):
+        return logging.getLogger("AI_Recruiter")
+
     log_dir = "logs"
     if not os.path.exists(log_dir):
         os.makedirs(log_dir)
@@ -13,10 +22,23 @@ def setup_logger():
         log_dir, f"recruitment_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
     )
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    handlers = [logging.FileHandler(log_file), logging.StreamHandler()]
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # Callers only enqueue records; formatting and file/console I/O happen
+    # on the listener's thread, off the event loop and request threads
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
     )
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Not basicConfig: it would give the QueueHandler a default formatter,
+    # and the record would be formatted twice
+    root.setLevel(logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logging.getLogger("AI_Recruiter")
@@ -1,10 +1,26 @@
 import json, ast
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ast.literal_eval walks a full AST; past this size it is not worth trying
+MAX_LITERAL_EVAL_CHARS = 1_000_000
+
+
+def _loads(text):
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
 def safe_parse(obj: Any) -> Dict:
     """
     Robust parser for orchestrator/matcher outputs.
     Always returns a dict so UI doesn't crash.
+
+    This is the slow path for text. In-process callers should hand agents a
+    structured "payload" dict instead (see BaseAgent._get_payload).
     """
     if obj is None:
         return {}
@@ -12,20 +28,29 @@ def safe_parse(obj: Any) -> Dict:
     if isinstance(obj, dict):
         return obj
 
+    if isinstance(obj, (bytes, bytearray)):
+        obj = obj.decode("utf-8", errors="replace")
+
     if isinstance(obj, str):
         text = obj.strip()
 
+        # Only JSON objects/arrays or Python dict/list literals can parse to
+        # something useful; skip the exception path for plain text
+        if not text or text[0] not in "{[":
+            return {"raw_output": text}
+
         # Try JSON
         try:
-            return json.loads(text)
-        except Exception:
+            return _loads(text)
+        except ValueError:
             pass
 
         # Try Python dict-like string
-        try:
-            return ast.literal_eval(text)
-        except Exception:
-            pass
+        if len(text) < MAX_LITERAL_EVAL_CHARS:
+            try:
+                return ast.literal_eval(text)
+            except Exception:
+                pass
 
         # Fallback: wrap raw string
         return {"raw_output": text}
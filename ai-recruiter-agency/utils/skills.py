@@ -0,0 +1,29 @@
+import functools
+import re
+from typing import FrozenSet
+
+_SPLIT = re.compile(r"\s*,\s*")
+_SPACES = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=8192)
+def tokenize_skills(text: str) -> FrozenSet[str]:
+    """
+    Normalize a comma separated skills string into a set of lowercase tokens.
+    Runs of whitespace inside a skill are collapsed, so "cyber security  expert"
+    and "Cyber Security Expert" are the same token. Cached, since the same
+    job and profile strings are tokenized on every allocation run.
+    """
+    return frozenset(
+        _SPACES.sub(" ", token) for token in _SPLIT.split(text.strip().lower()) if token
+    )
+
+
+@functools.lru_cache(maxsize=8192)
+def skill_pattern(skill: str) -> "re.Pattern[str]":
+    """
+    Compiled, case-insensitive pattern matching skill as a whole term.
+    "+" and "#" count as part of a term, so "c" does not match "C++" or "C#",
+    and "react" matches "Basic knowledge of React" but not "reactive".
+    """
+    return re.compile(r"(?<![\w+#])" + re.escape(skill) + r"(?![\w+#])", re.IGNORECASE)
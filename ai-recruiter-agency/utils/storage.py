@@ -0,0 +1,63 @@
+import json, os
+from typing import Any, Dict, List
+
+import streamlit as st
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+@st.cache_data(show_spinner=False)
+def _load_jsonl(path: str, mtime: float) -> List[Dict[str, Any]]:
+    """Parse a JSON-lines file. mtime is part of the cache key so edits invalidate it."""
+    with open(path, "r") as f:
+        return [_loads(line) for line in f if line.strip()]
+
+
+def _migrate_legacy(path: str) -> None:
+    """Convert an old pretty-printed data/*.json list into the .jsonl format once."""
+    legacy = os.path.splitext(path)[0] + ".json"
+    if os.path.exists(path) or not os.path.exists(legacy):
+        return
+    with open(legacy, "r") as f:
+        records = json.load(f)
+    with open(path, "w") as f:
+        f.writelines(json.dumps(r) + "\n" for r in records)
+
+
+def load_records(path: str) -> List[Dict[str, Any]]:
+    """
+    Load a JSON-lines file (students / organizations) from disk.
+    The file is only re-parsed when its mtime changes, not on every rerun.
+    """
+    _migrate_legacy(path)
+    if not os.path.exists(path):
+        return []
+    return _load_jsonl(path, os.path.getmtime(path))
+
+
+def append_record(path: str, record: Dict[str, Any]) -> None:
+    """Append one record as a single line; existing lines are never rewritten."""
+    _migrate_legacy(path)
+    with open(path, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    _load_jsonl.clear()
+
+
+def load_organizations(path: str) -> List[Dict[str, Any]]:
+    """
+    Load organizations, folding appended {"job": {...}} lines into the
+    organization registered most recently before them.
+    """
+    orgs = []
+    for record in load_records(path):
+        if "org_name" in record:
+            record.setdefault("jobs", [])
+            orgs.append(record)
+        elif "job" in record and orgs:
+            orgs[-1]["jobs"].append(record["job"])
+    return orgs